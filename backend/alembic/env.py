@@ -3,32 +3,31 @@
 from logging.config import fileConfig
 from sqlalchemy import engine_from_config, pool
 from alembic import context
-import os
-import sys
-from pathlib import Path
 
-# Ensure the 'backend' directory is on sys.path so `from app...` imports work
-CURRENT_FILE = Path(__file__).resolve()
-BACKEND_DIR = CURRENT_FILE.parents[1]  # .../backend
-if str(BACKEND_DIR) not in sys.path:
-    sys.path.insert(0, str(BACKEND_DIR))
+# backend/ is put on sys.path by `prepend_sys_path` in alembic.ini
 
-from app.core.config import settings
+from app.core.config import get_settings
 from app.infrastructure.database.base import Base
 
 # Import ORM models so Alembic can detect them
 from app.infrastructure.repositories import user  # noqa: F401
 
+settings = get_settings()
+
 # Cấu hình Alembic
 config = context.config
 if config.config_file_name is not None:
-    fileConfig(config.config_file_name)
+    # Giữ nguyên các logger đã cấu hình khi migration chạy in-process
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
 
 # Sử dụng DATABASE_URL từ .env
 config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
 
 target_metadata = Base.metadata
 
+# Tham số truyền qua `alembic -x key=value`
+x_args = context.get_x_argument(as_dictionary=True)
+
 
 def run_migrations_offline():
     url = settings.DATABASE_URL
@@ -37,20 +36,41 @@ def run_migrations_offline():
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        transaction_per_migration=True,
+        compare_type=True,
     )
     with context.begin_transaction():
         context.run_migrations()
 
 
-def run_migrations_online():
-    connectable = engine_from_config(
+def _engine():
+    return engine_from_config(
         config.get_section(config.config_ini_section),
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
     )
 
+
+def run_migrations_online():
+    connectable = _engine()
+    # -x schema=<tenant>: dùng bởi scripts/upgrade_tenants.py cho từng tenant
+    schema = x_args.get("schema")
+
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        if schema:
+            # Chạy migration trong schema của một tenant
+            quoted = connection.dialect.identifier_preparer.quote_schema(schema)
+            connection.exec_driver_sql(f"SET search_path TO {quoted}")
+            connection.commit()
+            connection.dialect.default_schema_name = schema
+        # Commit mỗi revision riêng để giữ lock và bộ nhớ ở mức một migration
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            transaction_per_migration=True,
+            compare_type=True,
+            version_table_schema=schema,
+        )
         with context.begin_transaction():
             context.run_migrations()
 
@@ -1,10 +1,13 @@
-from typing import Protocol, List
+from typing import Iterable, Protocol, List
 
 
 class ITranscriber(Protocol):
     def transcribe(self, audio_path: str) -> str:
         """Transcribe an audio file into text."""
 
+    def transcribe_stream(self, audio_path: str) -> Iterable[str]:
+        """Yield transcript segments as soon as each one is ready."""
+
 
 class IMediaProcessor(Protocol):
     def extract_frames(self, video_path: str, fps: int) -> List[str]:
@@ -2,10 +2,21 @@ from typing import Protocol, Any, Dict, List
 
 
 class IPipelineStep(Protocol):
+    """A pipeline step.
+
+    Steps may also define `requires` / `produces` (frozensets of context
+    keys they read / write). These are optional and only used by
+    DagPipeline, so they are not Protocol members.
+    """
+
     name: str
 
     def run(self, context: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute step with context, return updated context."""
+        """Execute step with context, return updated context.
+
+        Steps may mutate `context` in place and return the same dict; a
+        different dict returned is merged into the shared context.
+        """
 
 
 class IPipeline(Protocol):
@@ -4,13 +4,17 @@ from app.domain.entities.user import User
 
 class IUserRepository(ABC):
     @abstractmethod
-    def create(self, user: User) -> User:
+    async def create(self, user: User) -> User:
         pass
 
     @abstractmethod
-    def get_by_id(self, user_id: int) -> User:
+    async def get_by_id(self, user_id: int) -> User:
         pass
 
     @abstractmethod
-    def get_all(self) -> list[User]:
+    async def get_all(self) -> list[User]:
+        pass
+
+    @abstractmethod
+    async def get_page(self, limit: int, offset: int = 0) -> list[User]:
         pass
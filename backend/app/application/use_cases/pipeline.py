@@ -1,13 +1,101 @@
-from typing import Dict, Any, List
+import asyncio
+from typing import Dict, Any, List, Tuple
 
 from app.application.interfaces.pipeline import IPipeline, IPipelineStep
 
 
 class SimplePipeline(IPipeline):
+    """Run steps in order over one shared, mutable context dict."""
+
+    def __init__(self, steps: List[IPipelineStep]):
+        self.steps = steps
+        # Resolve `step.run` once instead of on every execution
+        self._runs = tuple(step.run for step in steps)
+
+    def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        for run in self._runs:
+            result = run(context)
+            if result is not context:
+                context.update(result)
+        return context
+
+
+class StrictSimplePipeline(SimplePipeline):
+    """Never mutate the caller's dict: each step gets its own copy and
+    its return value replaces the context."""
+
+    def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        for run in self._runs:
+            context = run(dict(context))
+        return context
+
+
+class DagPipeline(IPipeline):
+    """Run steps in dependency "waves"; steps within a wave are independent.
+
+    A step runs after every earlier step that writes a key it reads, that
+    writes a key it writes, or that reads a key it writes. Keys nobody
+    produces must come from the initial context. A step that declares
+    neither `requires` nor `produces` is a barrier: it runs after all
+    earlier steps and before all later ones. With no declarations at all
+    the pipeline behaves like SimplePipeline.
+    """
+
     def __init__(self, steps: List[IPipelineStep]):
         self.steps = steps
+        self._waves = self._build_waves(steps)
+
+    @staticmethod
+    def _build_waves(steps: List[IPipelineStep]) -> Tuple[Tuple[IPipelineStep, ...], ...]:
+        last_writer: Dict[str, int] = {}
+        readers: Dict[str, List[int]] = {}  # readers since the last write of each key
+        level: List[int] = []
+        floor = 0  # wave right after the latest barrier step
+        for i, step in enumerate(steps):
+            if not (hasattr(step, "requires") or hasattr(step, "produces")):
+                lvl = max(level, default=-1) + 1
+                level.append(lvl)
+                floor = lvl + 1
+                continue
+            requires = getattr(step, "requires", frozenset())
+            produces = getattr(step, "produces", frozenset())
+            deps = [last_writer[key] for key in requires | produces if key in last_writer]
+            deps += [r for key in produces for r in readers.get(key, ())]
+            level.append(max([floor] + [level[d] + 1 for d in deps]))
+            for key in requires:
+                readers.setdefault(key, []).append(i)
+            for key in produces:
+                last_writer[key] = i
+                readers[key] = []
+        waves: List[List[IPipelineStep]] = [[] for _ in range(max(level, default=-1) + 1)]
+        for step, lvl in zip(steps, level):
+            waves[lvl].append(step)
+        return tuple(tuple(wave) for wave in waves)
 
     def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
-        for step in self.steps:
-            context = step.run(context)
+        for wave in self._waves:
+            for step in wave:
+                result = step.run(context)
+                if result is not context:
+                    context.update(result)
+        return context
+
+    async def execute_async(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        for wave in self._waves:
+            if len(wave) == 1:
+                result = await asyncio.to_thread(wave[0].run, context)
+                if result is not context:
+                    context.update(result)
+                continue
+            # Mỗi step song song nhận bản copy; chỉ merge các key nó thay đổi
+            snapshot = dict(context)
+            results = await asyncio.gather(
+                *(asyncio.to_thread(step.run, dict(snapshot)) for step in wave)
+            )
+            for result in results:
+                context.update(
+                    (key, value)
+                    for key, value in result.items()
+                    if key not in snapshot or value is not snapshot[key]
+                )
         return context
@@ -1,8 +1,13 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List
 
 from app.application.interfaces.media import ITranscriber
 from app.application.interfaces.llm import IEmbeddingService
 
+MAX_TRANSCRIBE_WORKERS = 8
+EMBED_GROUP_SIZE = 32
+
 
 class TranscribeAndEmbedUseCase:
     def __init__(self, transcriber: ITranscriber, embedder: IEmbeddingService):
@@ -13,3 +18,58 @@ class TranscribeAndEmbedUseCase:
         text = self.transcriber.transcribe(audio_path)
         vectors: List[List[float]] = self.embedder.embed([text])
         return {"text": text, "embedding": vectors[0] if vectors else []}
+
+    def execute_many(self, audio_paths: List[str]) -> List[Dict[str, Any]]:
+        """Transcribe files concurrently, then embed all texts in one batch call."""
+        if not audio_paths:
+            return []
+        workers = min(MAX_TRANSCRIBE_WORKERS, len(audio_paths))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            texts = list(pool.map(self.transcriber.transcribe, audio_paths))
+        return self._embed_batch(texts)
+
+    async def execute_async(self, audio_paths: List[str]) -> List[Dict[str, Any]]:
+        """Async variant of `execute_many` for use inside the event loop."""
+        if not audio_paths:
+            return []
+        texts = await asyncio.gather(
+            *(asyncio.to_thread(self.transcriber.transcribe, p) for p in audio_paths)
+        )
+        return await asyncio.to_thread(self._embed_batch, list(texts))
+
+    async def execute_streaming(self, audio_path: str) -> Dict[str, Any]:
+        """Embed transcript segments while later segments are still transcribing.
+
+        Returns the joined text and one embedding per segment, in order.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def embed_groups() -> List[List[float]]:
+            vectors: List[List[float]] = []
+            while (group := await queue.get()) is not None:
+                vectors.extend(await asyncio.to_thread(self.embedder.embed, group))
+            return vectors
+
+        consumer = asyncio.create_task(embed_groups())
+        segments: List[str] = []
+        group: List[str] = []
+        stream = iter(self.transcriber.transcribe_stream(audio_path))
+        try:
+            while (segment := await asyncio.to_thread(next, stream, None)) is not None:
+                segments.append(segment)
+                group.append(segment)
+                if len(group) >= EMBED_GROUP_SIZE:
+                    queue.put_nowait(group)
+                    group = []
+            if group:
+                queue.put_nowait(group)
+            queue.put_nowait(None)
+        except BaseException:
+            consumer.cancel()
+            raise
+        vectors = await consumer
+        return {"text": " ".join(segments), "embeddings": vectors}
+
+    def _embed_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        vectors: List[List[float]] = self.embedder.embed(texts)
+        return [{"text": t, "embedding": v} for t, v in zip(texts, vectors)]
@@ -1,17 +1,25 @@
+from cachetools import TTLCache
+
 from app.application.interfaces.user import IUserRepository
 from app.domain.entities.user import User
 from app.domain.services.user import RecommendationService
 
+# Cache kết quả recommend theo user_id trong process, hết hạn sau 60s
+recommendation_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
 
 class CreateUserUseCase:
     def __init__(self, repo: IUserRepository):
         self.repo = repo
 
-    def execute(self, name: str, email: str, preferences: list[str]) -> User:
+    async def execute(self, name: str, email: str, preferences: list[str]) -> User:
         # Validate với Pydantic
         user_data = {"id": 0, "name": name, "email": email, "preferences": preferences}
         user = User(**user_data)  # Pydantic sẽ validate tự động
-        return self.repo.create(user)
+        created = await self.repo.create(user)
+        # User mới có thể xuất hiện trong recommend của bất kỳ ai
+        recommendation_cache.clear()
+        return created
 
 
 class RecommendUsersUseCase:
@@ -19,7 +27,15 @@ class RecommendUsersUseCase:
         self.repo = repo
         self.rec_service = RecommendationService()
 
-    def execute(self, user_id: int) -> list[str]:
-        user = self.repo.get_by_id(user_id)
-        all_users = self.repo.get_all()
-        return self.rec_service.recommend(user, all_users)
+    async def execute(self, user_id: int) -> list[str]:
+        cached = recommendation_cache.get(user_id)
+        if cached is not None:
+            return cached
+        # Một query duy nhất: user cần recommend cũng nằm trong all_users
+        all_users = await self.repo.get_all()
+        user = next((u for u in all_users if u.id == user_id), None)
+        if user is None:
+            raise ValueError("User not found")
+        recs = self.rec_service.recommend(user, all_users)
+        recommendation_cache[user_id] = recs
+        return recs
@@ -1,17 +1,14 @@
-from typing import Generator
-from sqlalchemy.orm import Session
-from app.infrastructure.database.base import SessionLocal
+from typing import AsyncGenerator
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
-def get_db() -> Generator[Session, None, None]:
-    """Per-request SQLAlchemy Session lifecycle.
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Per-request SQLAlchemy AsyncSession lifecycle.
 
-    - Open session before handling the endpoint
+    - Open session from the factory created in the app lifespan
     - Ensure session is closed after handling (even on exception)
     - Commit/Rollback should be controlled in use cases or a unit of work
     """
-    db = SessionLocal()
-    try:
+    async with request.app.state.session_factory() as db:
         yield db
-    finally:
-        db.close()
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, field_validator
+from typing import Annotated
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class KpiReport(BaseModel):
-    model_config = {"extra": "forbid", "validate_assignment": True}
+    model_config = ConfigDict(extra="forbid", validate_assignment=False)
 
     throughput_per_staff: dict
-    avg_handling_time: float
+    avg_handling_time: Annotated[float, Field(ge=0)]
 
     @field_validator("throughput_per_staff")
     @classmethod
@@ -21,10 +23,3 @@ class KpiReport(BaseModel):
             if not isinstance(val, int) or val < 0:
                 raise ValueError("throughput_per_staff values must be non-negative ints")
         return v
-
-    @field_validator("avg_handling_time")
-    @classmethod
-    def _validate_avg(cls, v: float) -> float:
-        if not isinstance(v, (int, float)) or v < 0:
-            raise ValueError("avg_handling_time must be non-negative number")
-        return float(v)
@@ -1,27 +1,14 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, field_validator
+from typing import Annotated, Literal
 
+from pydantic import BaseModel, ConfigDict, Field
 
-class Manager(BaseModel):
-    model_config = {"extra": "forbid", "validate_assignment": True}
+ManagerRole = Literal["manager", "staff"]
 
-    id: int
-    role: str
 
-    @field_validator("id")
-    @classmethod
-    def _validate_id(cls, v: int) -> int:
-        if v < 1:
-            raise ValueError("id must be positive")
-        return v
+class Manager(BaseModel):
+    model_config = ConfigDict(extra="forbid", validate_assignment=False)
 
-    @field_validator("role")
-    @classmethod
-    def _validate_role(cls, v: str) -> str:
-        if not isinstance(v, str) or not v.strip():
-            raise ValueError("role must be non-empty string")
-        allowed = {"manager", "staff"}
-        if v not in allowed:
-            raise ValueError(f"Invalid role: {v}")
-        return v
+    id: Annotated[int, Field(ge=1)]
+    role: ManagerRole
@@ -1,58 +1,22 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional, List
+from typing import Annotated, Any, List, Literal, Optional
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, Field
+
+OrderStatus = Literal["new", "confirmed", "packaged"]
 
 
 class Order(BaseModel):
-    model_config = {"extra": "forbid", "validate_assignment": True}
+    model_config = ConfigDict(extra="forbid", validate_assignment=False)
 
-    id: int
-    items: List
-    status: str
+    id: Annotated[int, Field(ge=0)]
+    items: Annotated[List[Any], Field(min_length=1)]
+    status: OrderStatus
     staff_id: Optional[int] = None
     confirmed_at: Optional[datetime] = None
-    processing_time: Optional[float] = None
-
-    # ---------- Validators ----------
-    @field_validator("id")
-    @classmethod
-    def _validate_id(cls, v: int) -> int:
-        if v < 0:
-            raise ValueError("id must be non-negative")
-        return v
-
-    @field_validator("items")
-    @classmethod
-    def _validate_items(cls, v: List) -> List:
-        if not isinstance(v, list):
-            raise ValueError("items must be a list")
-        if len(v) == 0:
-            raise ValueError("items cannot be empty")
-        return v
-
-    @field_validator("status")
-    @classmethod
-    def _validate_status(cls, v: str) -> str:
-        if not isinstance(v, str) or not v.strip():
-            raise ValueError("status must be a non-empty string")
-        allowed = {"new", "confirmed", "packaged"}
-        if v not in allowed:
-            # keep flexible but still deterministic: allow any non-empty status, but flag unexpected
-            # Raising to enforce cleanliness per rules
-            raise ValueError(f"Invalid status: {v}")
-        return v
-
-    @field_validator("processing_time")
-    @classmethod
-    def _validate_processing_time(cls, v: Optional[float]) -> Optional[float]:
-        if v is None:
-            return v
-        if not isinstance(v, (int, float)) or v < 0:
-            raise ValueError("processing_time must be a non-negative number when provided")
-        return float(v)
+    processing_time: Optional[Annotated[float, Field(ge=0)]] = None
 
     # ---------- Methods (business rules) ----------
     def validate_data(self, order_data: dict) -> None:
@@ -78,7 +42,7 @@ class Order(BaseModel):
         self.status = "confirmed"
         self.confirmed_at = timestamp
 
-    def validate_status(self, expected_status: str) -> None:
+    def validate_status(self, expected_status: OrderStatus) -> None:
         if self.status != expected_status:
             raise ValueError(f"Expected status '{expected_status}', got '{self.status}'")
 
@@ -1,23 +1,17 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Annotated
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PackagingAudit(BaseModel):
-    model_config = {"extra": "forbid", "validate_assignment": True}
+    model_config = ConfigDict(extra="forbid", validate_assignment=False)
 
-    order_id: int
+    order_id: Annotated[int, Field(ge=1)]
     timestamp: datetime
 
-    @field_validator("order_id")
-    @classmethod
-    def _validate_order_id(cls, v: int) -> int:
-        if v < 1:
-            raise ValueError("order_id must be positive")
-        return v
-
     @classmethod
     def create(cls, order_id: int) -> "PackagingAudit":
         # Deterministic timestamp to avoid using system clock in code under test
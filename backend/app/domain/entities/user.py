@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pydantic import BaseModel, EmailStr, field_validator
 
 
@@ -13,3 +15,8 @@ class User(BaseModel):
         if not v:
             raise ValueError("Preferences cannot be empty")
         return v
+
+    @cached_property
+    def preference_set(self) -> frozenset[str]:
+        """Preferences as a set for O(1) membership checks (computed once)."""
+        return frozenset(self.preferences)
@@ -18,7 +18,8 @@ class AvgProcessingTimeService:
     def compute_avg_time(orders: List[Order]) -> float:
         if not isinstance(orders, list):
             raise ValueError("orders must be a list")
-        times: List[float] = []
+        total = 0.0
+        count = 0
         for o in orders:
             # allow duck-typing: dict or pydantic Order with attribute
             val = None
@@ -30,7 +31,6 @@ class AvgProcessingTimeService:
                 continue
             if not isinstance(val, (int, float)) or val < 0:
                 raise ValueError("processing_time must be non-negative number when provided")
-            times.append(float(val))
-        if not times:
-            return 0.0
-        return sum(times) / len(times)
+            total += val
+            count += 1
+        return total / count if count else 0.0
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import Counter
 from typing import Dict, List
 
 from app.domain.entities.order import Order
@@ -15,7 +16,7 @@ class OrdersPerStaffService:
     def compute_throughput(orders: List[Order]) -> Dict[int, int]:
         if not isinstance(orders, list):
             raise ValueError("orders must be a list")
-        result: Dict[int, int] = {}
+        counts: Counter[int] = Counter()
         for o in orders:
             staff_id = None
             if isinstance(o, dict):
@@ -26,5 +27,5 @@ class OrdersPerStaffService:
                 continue
             if not isinstance(staff_id, int) or staff_id < 0:
                 raise ValueError("staff_id must be a non-negative integer when provided")
-            result[staff_id] = result.get(staff_id, 0) + 1
-        return result
+            counts[staff_id] += 1
+        return dict(counts)
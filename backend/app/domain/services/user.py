@@ -1,20 +1,59 @@
-from backend.app.domain.entities.user import User
-from sklearn.metrics.pairwise import cosine_similarity  # Import AI lib
-import numpy as np
+import math
+
+from app.domain.entities.user import User
+
+# Mỗi preference trong vocab ứng với một bit trong mask
+_VOCAB = {"ai": 1, "ml": 2, "data": 4}
+
+
+def _mask(user: User) -> int:
+    prefs = user.preference_set
+    mask = 0
+    for pref, bit in _VOCAB.items():
+        if pref in prefs:
+            mask |= bit
+    return mask
 
 
 class RecommendationService:
     def recommend(self, user: User, all_users: list[User]) -> list[str]:
-        # AI logic: Simple cosine similarity trên preferences
-        user_vec = np.array(
-            [1 if pref in user.preferences else 0 for pref in ["ai", "ml", "data"]]
-        )
+        # AI logic: cosine similarity trên preferences dạng bitmask
+        # cos = |a & b| / sqrt(|a| * |b|) > 0.5  <=>  4 * |a & b|^2 > |a| * |b|
+        user_mask = _mask(user)
+        user_bits = user_mask.bit_count()
         recommendations = []
         for other in all_users:
-            other_vec = np.array(
-                [1 if pref in other.preferences else 0 for pref in ["ai", "ml", "data"]]
-            )
-            similarity = cosine_similarity([user_vec], [other_vec])[0][0]
-            if similarity > 0.5:
+            other_mask = _mask(other)
+            common = (user_mask & other_mask).bit_count()
+            if 4 * common * common > user_bits * other_mask.bit_count():
                 recommendations.append(other.name)
         return recommendations
+
+    def recommend_topk(self, user: User, all_users: list[User], k: int = 10) -> list[str]:
+        """Return at most `k` names above the threshold, best match first.
+
+        Uses the same exact integer threshold test as `recommend`; numpy is
+        only used to rank the users that pass it.
+        """
+        if not all_users or k <= 0:
+            return []
+        user_mask = _mask(user)
+        user_bits = user_mask.bit_count()
+        candidates: list[int] = []
+        scores: list[float] = []
+        for i, other in enumerate(all_users):
+            other_mask = _mask(other)
+            other_bits = other_mask.bit_count()
+            common = (user_mask & other_mask).bit_count()
+            if 4 * common * common > user_bits * other_bits:
+                candidates.append(i)
+                scores.append(common / math.sqrt(user_bits * other_bits))
+        if not candidates:
+            return []
+        import numpy as np  # chỉ load numpy khi thật sự cần top-K
+
+        sims = np.asarray(scores)
+        # Chọn K phần tử lớn nhất trong O(N), chỉ sort phần đã chọn
+        idx = np.argpartition(-sims, kth=min(k, len(sims) - 1))[:k]
+        idx = idx[np.argsort(-sims[idx])]
+        return [all_users[candidates[i]].name for i in idx]
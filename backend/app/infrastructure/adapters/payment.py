@@ -1,7 +1,15 @@
 from typing import Dict, Any, Optional
 
 from app.application.interfaces.payment import IPaymentGateway
-from app.core.config import settings
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# Import once at module load; app can still start without stripe for non-payment features
+try:
+    import stripe as _STRIPE  # type: ignore
+except ImportError:  # pragma: no cover
+    _STRIPE = None
 
 
 class StripeNotConfiguredError(RuntimeError):
@@ -19,15 +27,14 @@ class StripeClient(IPaymentGateway):
             raise StripeNotConfiguredError(
                 "STRIPE_SECRET_KEY is missing. Set it in environment."
             )
-        # Lazy import so app can start without stripe for non-payment features
-        try:
-            import stripe  # type: ignore
-        except Exception as e:  # pragma: no cover
+        if _STRIPE is None:  # pragma: no cover
             raise StripeNotConfiguredError(
                 "python-stripe SDK is not installed. Install with `venv/bin/pip install stripe`."
-            ) from e
-        self._stripe = stripe
-        self._stripe.api_key = self.api_key
+            )
+        self._stripe = _STRIPE
+        # api_key is module-global in the SDK: only write it when it changes
+        if self._stripe.api_key != self.api_key:
+            self._stripe.api_key = self.api_key
 
     def create_payment_intent(
         self,
@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from app.application.interfaces.media import ITranscriber
 
 
@@ -10,3 +12,7 @@ class WhisperTranscriber(ITranscriber):
     def transcribe(self, audio_path: str) -> str:
         # Stub: return a fake transcription derived from the filename
         return f"[stub-{self.model}] transcribed {audio_path}"
+
+    def transcribe_stream(self, audio_path: str) -> Iterator[str]:
+        # Stub: a single segment; real Whisper yields one item per decoded segment
+        yield self.transcribe(audio_path)
@@ -0,0 +1,93 @@
+import multiprocessing
+from argparse import Namespace
+from typing import Dict, Iterator, List, Optional, Tuple, Type
+
+from sqlalchemy import create_engine, inspect, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from app.core.config import get_settings
+from app.infrastructure.database.base import Base
+
+
+def paginated_iter(session: Session, model: Type[Base], page: int = 100) -> Iterator[Base]:
+    """Iterate over all rows of `model` in pages of `page` rows.
+
+    Dùng trong data migration để giữ bộ nhớ ở mức O(page) thay vì O(số dòng).
+    Pages are keyed on `model.id` (keyset), so each query stays an index
+    range scan instead of an ever-growing OFFSET. Wrap the writes in
+    ``with op.get_context().autocommit_block():`` so every page commits on
+    its own instead of holding one long transaction.
+    """
+    last_id = None
+    while True:
+        stmt = select(model).order_by(model.id).limit(page)
+        if last_id is not None:
+            stmt = stmt.where(model.id > last_id)
+        rows = session.execute(stmt).scalars().all()
+        if not rows:
+            return
+        yield from rows
+        last_id = rows[-1].id
+
+
+def upgrade_schema(config_file: str, schema: str, revision: str = "head") -> Tuple[str, Optional[str]]:
+    """Run ``alembic upgrade`` for one tenant schema; meant for a worker process.
+
+    Returns ``(schema, error)`` with ``error`` None on success so results
+    stay picklable across the process pool.
+    """
+    from alembic import command
+    from alembic.config import Config
+
+    cfg = Config(config_file, cmd_opts=Namespace(x=[f"schema={schema}"]))
+    try:
+        command.upgrade(cfg, revision)
+    except Exception as e:
+        return schema, str(e)
+    return schema, None
+
+
+def list_tenant_schemas(prefix: str = "tenant_") -> List[str]:
+    """Enumerate tenant schemas, releasing the connection before returning."""
+    engine = create_engine(get_settings().DATABASE_URL, poolclass=NullPool)
+    try:
+        with engine.connect() as connection:
+            names = inspect(connection).get_schema_names()
+    finally:
+        engine.dispose()
+    return sorted(n for n in names if n.startswith(prefix))
+
+
+def upgrade_tenants(
+    config_file: str,
+    schemas: List[str],
+    revision: str = "head",
+    workers: int = 6,
+    batch: int = 50,
+    continue_on_error: bool = False,
+) -> None:
+    """Upgrade each tenant schema to `revision`, each in its own process.
+
+    Mỗi worker tự tạo engine riêng (không chia sẻ connection với process cha).
+    Schemas are submitted in chunks of `batch`; failed schemas are retried
+    once when `continue_on_error` is set, otherwise the run stops after the
+    first chunk containing a failure.
+    """
+    jobs = [(config_file, s, revision) for s in schemas]
+    failures: Dict[str, str] = {}
+    with multiprocessing.Pool(workers) as pool:
+        for start in range(0, len(jobs), batch):
+            for name, error in pool.starmap(upgrade_schema, jobs[start : start + batch]):
+                if error:
+                    failures[name] = error
+            if failures and not continue_on_error:
+                break
+        if failures and continue_on_error:
+            retry = [(config_file, s, revision) for s in failures]
+            failures = {
+                name: error for name, error in pool.starmap(upgrade_schema, retry) if error
+            }
+    if failures:
+        details = "; ".join(f"{name}: {error}" for name, error in failures.items())
+        raise RuntimeError(f"Migration failed for {len(failures)} schema(s): {details}")
@@ -1,11 +1,12 @@
-from sqlalchemy import Column, Integer, String, ARRAY
+from sqlalchemy import String, ARRAY
+from sqlalchemy.orm import Mapped, mapped_column
 
 from app.infrastructure.database.base import Base
 
 
 class UserModel(Base):
     __tablename__ = "users"
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String)
-    email = Column(String, unique=True)
-    preferences = Column(ARRAY(String))
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    name: Mapped[str | None] = mapped_column(String)
+    email: Mapped[str | None] = mapped_column(String, unique=True, index=True)
+    preferences: Mapped[list[str] | None] = mapped_column(ARRAY(String))
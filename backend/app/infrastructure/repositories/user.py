@@ -1,42 +1,56 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.application.interfaces.user import IUserRepository
 from app.domain.entities.user import User
 from app.infrastructure.models.user import UserModel
 
+GET_ALL_BATCH_SIZE = 500
+
 
 class UserRepository(IUserRepository):
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession, cache: dict[int, User] | None = None):
         self.db = db
+        # Cache theo id trong phạm vi một request, tránh SELECT lặp lại
+        self._cache: dict[int, User] = {} if cache is None else cache
 
-    def create(self, user: User) -> User:
+    async def create(self, user: User) -> User:
         db_user = UserModel(
             name=user.name, email=user.email, preferences=user.preferences
         )
         self.db.add(db_user)
-        self.db.commit()
-        self.db.refresh(db_user)
+        await self.db.commit()
+        await self.db.refresh(db_user)
         # Trả về Pydantic User
-        return User(
+        user = self._cache[db_user.id] = self._to_entity(db_user)
+        return user
+
+    async def get_by_id(self, user_id: int) -> User:
+        if user_id in self._cache:
+            return self._cache[user_id]
+        result = await self.db.execute(select(UserModel).where(UserModel.id == user_id))
+        db_user = result.scalars().first()
+        if db_user:
+            user = self._cache[user_id] = self._to_entity(db_user)
+            return user
+        raise ValueError("User not found")
+
+    async def get_all(self) -> list[User]:
+        # Stream rows theo batch thay vì materialize toàn bộ bằng .all()
+        stmt = select(UserModel).execution_options(yield_per=GET_ALL_BATCH_SIZE)
+        result = await self.db.stream_scalars(stmt)
+        return [self._to_entity(u) async for u in result]
+
+    async def get_page(self, limit: int, offset: int = 0) -> list[User]:
+        stmt = select(UserModel).order_by(UserModel.id).limit(limit).offset(offset)
+        result = await self.db.execute(stmt)
+        return [self._to_entity(u) for u in result.scalars()]
+
+    @staticmethod
+    def _to_entity(db_user: UserModel) -> User:
+        # Dữ liệu từ DB đã hợp lệ, bỏ qua bước validate của Pydantic
+        return User.model_construct(
             id=db_user.id,
             name=db_user.name,
             email=db_user.email,
             preferences=db_user.preferences,
         )
-
-    def get_by_id(self, user_id: int) -> User:
-        db_user = self.db.query(UserModel).filter(UserModel.id == user_id).first()
-        if db_user:
-            return User(
-                id=db_user.id,
-                name=db_user.name,
-                email=db_user.email,
-                preferences=db_user.preferences,
-            )
-        raise ValueError("User not found")
-
-    def get_all(self) -> list[User]:
-        db_users = self.db.query(UserModel).all()
-        return [
-            User(id=u.id, name=u.name, email=u.email, preferences=u.preferences)
-            for u in db_users
-        ]
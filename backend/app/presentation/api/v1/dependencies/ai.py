@@ -1,11 +1,13 @@
 from fastapi import Depends
 
-from app.core.config import settings
+from app.core.config import get_settings
 
 from app.application.use_cases.transcribe_and_embed import TranscribeAndEmbedUseCase
 from app.infrastructure.adapters.llm import OpenAIChatClient, OpenAIEmbeddingClient
 from app.infrastructure.adapters.transcriber import WhisperTranscriber
 
+settings = get_settings()
+
 
 def get_transcriber():
     return WhisperTranscriber(settings.WHISPER_MODEL)
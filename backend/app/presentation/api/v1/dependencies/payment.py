@@ -1,10 +1,15 @@
-from fastapi import Depends
+from fastapi import Request
 
-from app.core.config import settings
+from app.core.config import get_settings
 from app.infrastructure.adapters.payment import StripeClient
 
+settings = get_settings()
 
-def get_stripe_client() -> StripeClient:
-    # Raise clear error if not configured
-    client = StripeClient(api_key=settings.STRIPE_SECRET_KEY)
+
+def get_stripe_client(request: Request) -> StripeClient:
+    # Client được tạo một lần trong lifespan; None nghĩa là Stripe chưa cấu hình
+    client = request.app.state.stripe
+    if client is None:
+        # Raise clear error if not configured
+        client = StripeClient(api_key=settings.STRIPE_SECRET_KEY)
     return client
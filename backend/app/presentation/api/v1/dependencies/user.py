@@ -1,12 +1,15 @@
-from fastapi import Depends
-from sqlalchemy.orm import Session
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.db import get_db
 from app.infrastructure.repositories.user import UserRepository
 
-def get_user_repo(db: Session = Depends(get_db)) -> UserRepository:
-    """Khởi tạo UserRepository từ Session được inject.
+def get_user_repo(request: Request, db: AsyncSession = Depends(get_db)) -> UserRepository:
+    """Khởi tạo UserRepository từ AsyncSession được inject.
 
     Dependency này giữ presentation layer độc lập với hạ tầng DB,
     giúp dễ test/override trong unit test.
     """
-    return UserRepository(db)
+    # Cache user theo request, dùng chung cho mọi repo trong cùng request
+    if not hasattr(request.state, "user_cache"):
+        request.state.user_cache = {}
+    return UserRepository(db, cache=request.state.user_cache)
@@ -1,4 +1,7 @@
-from fastapi import APIRouter, Depends
+import hashlib
+import json
+
+from fastapi import APIRouter, Depends, Request, Response
 
 from app.application.use_cases.user import (
     CreateUserUseCase,
@@ -14,16 +17,36 @@ from app.presentation.api.v1.schemas.user import (
 
 router = APIRouter()
 
+RECOMMEND_CACHE_CONTROL = "private, max-age=30"
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison for If-None-Match (RFC 7232 §3.2): ignore the W/ prefix."""
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
 
 @router.post("/users/", response_model=UserResponse)
-def create_user(request: CreateUserRequest, repo=Depends(get_user_repo)):
+async def create_user(request: CreateUserRequest, repo=Depends(get_user_repo)):
     use_case = CreateUserUseCase(repo)
-    user = use_case.execute(request.name, request.email, request.preferences)
-    return UserResponse.from_orm(user)  # Hoặc user.dict() nếu không dùng from_orm
+    # response_model lo việc validate/serialize, chỉ một lần
+    return await use_case.execute(request.name, request.email, request.preferences)
 
 
 @router.get("/recommend/{user_id}", response_model=RecommendationResponse)
-def recommend(user_id: int, repo=Depends(get_user_repo)):
+async def recommend(
+    user_id: int, request: Request, response: Response, repo=Depends(get_user_repo)
+):
     use_case = RecommendUsersUseCase(repo)
-    recs = use_case.execute(user_id)
-    return RecommendationResponse(recommendations=recs)
+    recs = await use_case.execute(user_id)
+    digest = hashlib.blake2b(json.dumps(recs).encode(), digest_size=16).hexdigest()
+    etag = f'"{digest}"'
+    headers = {"ETag": etag, "Cache-Control": RECOMMEND_CACHE_CONTROL}
+    # Client đã có bản mới nhất: trả 304, không gửi body
+    if _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return {"recommendations": recs}
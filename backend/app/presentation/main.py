@@ -1,88 +1,141 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 import uvicorn
+import hashlib
 import os
-import subprocess
 from datetime import datetime
 from pathlib import Path
 import sys
 
+from app.infrastructure.adapters.payment import StripeClient, StripeNotConfiguredError
+from app.infrastructure.database.base import create_engine, create_session_factory
 from app.presentation.api.v1.routers import user
 
-app = FastAPI(title="FastAPI Onion App")
+# Đường dẫn tính một lần khi import module
+CURRENT_FILE = Path(__file__).resolve()
+BACKEND_APP_DIR = CURRENT_FILE.parents[1]  # backend/app
+BACKEND_DIR = CURRENT_FILE.parents[2]  # backend/
+PROJECT_ROOT = BACKEND_DIR.parent  # repo root
+# Prefer alembic.ini under backend/, fallback to repo root if not found
+ALEMBIC_INI = (
+    BACKEND_DIR / "alembic.ini"
+    if (BACKEND_DIR / "alembic.ini").exists()
+    else PROJECT_ROOT / "alembic.ini"
+)
+
+
+def _dev_mode() -> bool:
+    return os.getenv("DEV_MODE", "true").lower() == "true"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared resources before serving and release them on shutdown."""
+    app.state.engine = create_engine()
+    app.state.session_factory = create_session_factory(app.state.engine)
+    try:
+        app.state.stripe = StripeClient()
+    except StripeNotConfiguredError:
+        # App vẫn chạy được cho các tính năng không cần thanh toán
+        app.state.stripe = None
+    yield
+    await app.state.engine.dispose()
+
+
+app = FastAPI(
+    title="FastAPI Onion App",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 app.include_router(user.router, prefix="/users", tags=["users"])
 
 
 def main():
-    dev_mode = os.getenv("DEV_MODE", "true").lower() == "true"
-    # Compute reload directory to avoid hardcoded absolute paths
-    current_file = Path(__file__).resolve()
-    backend_app_dir = current_file.parent.parent  # backend/app
+    dev_mode = _dev_mode()
     if dev_mode:
+        # Chạy một lần trong process cha, trước khi uvicorn spawn worker
         print(
             "🔄 Checking for schema changes and running Alembic migrations in DEV mode..."
         )
         run_alembic_autogen_and_upgrade()
+    # Production: nhiều worker (quy tắc 2n+1), reload chỉ chạy với 1 worker.
+    # Tương đương: gunicorn -k uvicorn.workers.UvicornWorker -w $WEB_CONCURRENCY
+    workers = 1 if dev_mode else int(
+        os.getenv("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1)
+    )
+    # Worker processes đọc biến này để chia DB_MAX_CONNECTIONS cho pool của mình
+    os.environ["WEB_CONCURRENCY"] = str(workers)
     uvicorn.run(
         "app.presentation.main:app",
         host="0.0.0.0",
         port=8006,
         reload=dev_mode,
-        reload_dirs=[str(backend_app_dir)],
-        # reload_excludes=["/home/kira7/workspace/template/fastapi_onion/postgres_data"],
+        workers=workers,
+        reload_dirs=[str(BACKEND_APP_DIR)],
+        # Chỉ theo dõi file .py; watchfiles (có trong uvicorn[standard]) lo phần watch
+        reload_includes=["*.py"],
+        reload_excludes=[
+            "**/__pycache__/*",
+            "**/*.pyc",
+            "**/alembic/versions/*",
+            "postgres_data/*",
+        ],
+        # uvloop/httptools đi kèm uvicorn[standard]; uvloop không hỗ trợ Windows
+        loop="uvloop" if sys.platform != "win32" else "auto",
+        http="httptools" if sys.platform != "win32" else "auto",
     )
 
 
 def run_alembic_autogen_and_upgrade():
     """Tự động generate migration + upgrade DB"""
+    # Import trong hàm: chỉ DEV mode mới cần Alembic
+    from alembic import command
+    from alembic.config import Config
+    from alembic.util.exc import CommandError
+    from sqlalchemy.exc import SQLAlchemyError
+
     try:
-        # Resolve important paths
-        current_file = Path(__file__).resolve()
-        backend_dir = current_file.parent.parent.parent  # backend/
-        project_root = backend_dir.parent  # repo root
-        # Prefer alembic.ini under backend/, fallback to repo root if not found
-        backend_ini = backend_dir / "alembic.ini"
-        if backend_ini.exists():
-            alembic_ini = backend_ini
-            working_dir = backend_dir
-            ini_arg = "alembic.ini"
+        cfg = Config(str(ALEMBIC_INI))
+        # script_location trong ini là đường dẫn tương đối so với file ini
+        script_location = ALEMBIC_INI.parent / cfg.get_main_option("script_location")
+        cfg.set_main_option("script_location", str(script_location))
+
+        # 1. Autogenerate migration file, chỉ khi models thay đổi
+        hash_file = BACKEND_DIR / ".alembic_last_hash"
+        fingerprint = _metadata_fingerprint()
+        if hash_file.exists() and hash_file.read_text().strip() == fingerprint:
+            print("⏭️  Models unchanged, skipping Alembic autogenerate.")
         else:
-            alembic_ini = project_root / "alembic.ini"
-            working_dir = project_root
-            ini_arg = str(alembic_ini)
-
-        # 1. Autogenerate migration file
-        msg = f"auto migration {datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        # Use venv's Alembic executable and clear PYTHONPATH so project 'backend/alembic' doesn't shadow package
-        venv_bin = Path(sys.executable).parent
-        alembic_exe = venv_bin / "alembic"
-        clean_env = os.environ.copy()
-        clean_env.pop("PYTHONPATH", None)
-        subprocess.run(
-            [
-                str(alembic_exe),
-                "-c",
-                ini_arg,
-                "revision",
-                "--autogenerate",
-                "-m",
-                msg,
-            ],
-            check=True,
-            cwd=str(working_dir),
-            env=clean_env,
-        )
-        print(f"✅ Alembic autogenerate done: {msg}")
+            msg = f"auto migration {datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            command.revision(cfg, message=msg, autogenerate=True)
+            hash_file.write_text(fingerprint)
+            print(f"✅ Alembic autogenerate done: {msg}")
 
         # 2. Upgrade DB
-        subprocess.run(
-            [str(alembic_exe), "-c", ini_arg, "upgrade", "head"],
-            check=True,
-            cwd=str(working_dir),
-            env=clean_env,
-        )
+        command.upgrade(cfg, "head")
         print("✅ Alembic migration applied.")
 
-    except subprocess.CalledProcessError as e:
+    except (CommandError, SQLAlchemyError) as e:
         print(f"❌ Alembic migration failed: {e}")
         exit(1)
+
+
+def _metadata_fingerprint() -> str:
+    """Hash table/column definitions of the ORM metadata."""
+    from app.infrastructure.database.base import Base
+    import app.infrastructure.models.user  # noqa: F401  (register models)
+
+    schema = sorted(
+        (
+            t.name,
+            sorted(
+                (c.name, str(c.type), c.nullable, c.primary_key, bool(c.unique), bool(c.index))
+                for c in t.columns
+            ),
+        )
+        for t in Base.metadata.sorted_tables
+    )
+    return hashlib.sha256(repr(schema).encode()).hexdigest()
@@ -0,0 +1,46 @@
+"""Upgrade every tenant schema in parallel.
+
+Run from backend/:  PYTHONPATH=. python scripts/upgrade_tenants.py head --schemas auto
+"""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from app.infrastructure.database.migration import list_tenant_schemas, upgrade_tenants
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("revision", nargs="?", default="head")
+    parser.add_argument(
+        "--schemas", required=True, help="comma-separated schema names, or 'auto'"
+    )
+    parser.add_argument("--schema-prefix", default="tenant_", help="used with --schemas auto")
+    parser.add_argument("--workers", type=int, default=6)
+    parser.add_argument("--batch", type=int, default=50)
+    parser.add_argument(
+        "--continue", dest="continue_on_error", action="store_true",
+        help="keep going past failed schemas and retry them once",
+    )
+    parser.add_argument("--config", default=str(BACKEND_DIR / "alembic.ini"))
+    args = parser.parse_args()
+
+    if args.schemas == "auto":
+        schemas = list_tenant_schemas(args.schema_prefix)
+    else:
+        schemas = [s.strip() for s in args.schemas.split(",") if s.strip()]
+    upgrade_tenants(
+        args.config,
+        schemas,
+        revision=args.revision,
+        workers=args.workers,
+        batch=args.batch,
+        continue_on_error=args.continue_on_error,
+    )
+
+
+if __name__ == "__main__":
+    main()